@@ -0,0 +1,155 @@
+"""Bit-encoded card representation and fast hand evaluation.
+
+Cards use the Cactus-Kev 32-bit layout:
+
+    xxxAKQJT 98765432 CDHSrrrr xxPPPPPP
+
+where the high short is a one-hot rank bit, CDHS is a one-hot suit
+nibble, rrrr is the rank index and PPPPPP is the rank's prime. A flush
+is then a single AND across five cards, and the rank category of any
+five cards is a table lookup keyed by the product of their rank primes.
+The two tables cover all 7462 distinct five-card hand values and are
+built once at import time.
+"""
+
+from itertools import combinations, combinations_with_replacement
+from typing import Dict, Iterable, List, Tuple
+
+RANKS = "23456789TJQKA"
+SUITS = "cdhs"
+PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+
+RANK_IDX = {rank: i for i, rank in enumerate(RANKS)}
+SUIT_BIT = {suit: 0x8000 >> i for i, suit in enumerate(SUITS)}
+
+# Hand categories, higher is better
+HIGH_CARD = 0
+ONE_PAIR = 1
+TWO_PAIR = 2
+THREE_OF_A_KIND = 3
+STRAIGHT = 4
+FLUSH = 5
+FULL_HOUSE = 6
+FOUR_OF_A_KIND = 7
+STRAIGHT_FLUSH = 8
+
+# Number of distinct five-card hand values
+NUM_HAND_RANKS = 7462
+
+def encode_card(card_str: str) -> int:
+    """Encode a two-char card like 'As' into its 32-bit representation"""
+    rank = RANK_IDX[card_str[0]]
+    suit = SUIT_BIT[card_str[1]]
+    return (1 << (16 + rank)) | suit | (rank << 8) | PRIMES[rank]
+
+def encode_cards(card_strs: Iterable[str]) -> List[int]:
+    """Encode a sequence of two-char cards"""
+    return [encode_card(card_str) for card_str in card_strs]
+
+def _straight_high(rank_set: frozenset) -> int:
+    """High-card rank of a straight, -1 if the ranks aren't one; wheel counts"""
+    if len(rank_set) != 5:
+        return -1
+    if rank_set == frozenset((12, 0, 1, 2, 3)):  # A-5 wheel
+        return 3
+    low = min(rank_set)
+    if rank_set == frozenset(range(low, low + 5)):
+        return low + 4
+    return -1
+
+def _rank_key(ranks: Tuple[int, ...], flush: bool) -> Tuple:
+    """Sortable strength key (higher sorts stronger) for a 5-card rank multiset"""
+    counts: Dict[int, int] = {}
+    for rank in ranks:
+        counts[rank] = counts.get(rank, 0) + 1
+    # Order ranks by multiplicity first, then rank, to break ties
+    groups = sorted(counts.items(), key=lambda item: (item[1], item[0]), reverse=True)
+    shape = tuple(count for _, count in groups)
+    kickers = tuple(rank for rank, _ in groups)
+
+    straight_high = _straight_high(frozenset(ranks)) if shape == (1, 1, 1, 1, 1) else -1
+
+    if flush:
+        category = STRAIGHT_FLUSH if straight_high >= 0 else FLUSH
+    elif shape == (4, 1):
+        category = FOUR_OF_A_KIND
+    elif shape == (3, 2):
+        category = FULL_HOUSE
+    elif straight_high >= 0:
+        category = STRAIGHT
+    elif shape == (3, 1, 1):
+        category = THREE_OF_A_KIND
+    elif shape == (2, 2, 1):
+        category = TWO_PAIR
+    elif shape == (2, 1, 1, 1):
+        category = ONE_PAIR
+    else:
+        category = HIGH_CARD
+
+    if straight_high >= 0:
+        kickers = (straight_high,)
+    return (category, kickers)
+
+def _build_tables() -> Tuple[Dict[int, int], Dict[int, int]]:
+    """Build the prime-product -> hand rank tables (1 is best, 7462 worst)"""
+    entries = []  # (key, prime_product, flush)
+
+    # Flushes and straight flushes: distinct ranks, all one suit
+    for ranks in combinations(range(13), 5):
+        product = 1
+        for rank in ranks:
+            product *= PRIMES[rank]
+        entries.append((_rank_key(ranks, True), product, True))
+
+    # Everything else: rank multisets with no rank more than four times
+    for ranks in combinations_with_replacement(range(13), 5):
+        if max(ranks.count(rank) for rank in ranks) > 4:
+            continue
+        product = 1
+        for rank in ranks:
+            product *= PRIMES[rank]
+        entries.append((_rank_key(ranks, False), product, False))
+
+    entries.sort(key=lambda entry: entry[0], reverse=True)
+
+    flush_ranks: Dict[int, int] = {}
+    unsuited_ranks: Dict[int, int] = {}
+    for hand_rank, (_, product, flush) in enumerate(entries, start=1):
+        if flush:
+            flush_ranks[product] = hand_rank
+        else:
+            unsuited_ranks[product] = hand_rank
+    return flush_ranks, unsuited_ranks
+
+FLUSH_RANKS, UNSUITED_RANKS = _build_tables()
+
+def evaluate_five(c1: int, c2: int, c3: int, c4: int, c5: int) -> int:
+    """Rank five encoded cards; 1 is a royal flush, 7462 is 7-5-4-3-2 offsuit"""
+    product = (c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF) * (c5 & 0xFF)
+    if c1 & c2 & c3 & c4 & c5 & 0xF000:
+        return FLUSH_RANKS[product]
+    return UNSUITED_RANKS[product]
+
+def evaluate_seven(cards: List[int]) -> int:
+    """Best five-card rank among seven encoded cards"""
+    return min(evaluate_five(*combo) for combo in combinations(cards, 5))
+
+def hand_category(hand_rank: int) -> int:
+    """Map a 1..7462 hand rank back to its category constant"""
+    if hand_rank <= 10:
+        return STRAIGHT_FLUSH
+    if hand_rank <= 166:
+        return FOUR_OF_A_KIND
+    if hand_rank <= 322:
+        return FULL_HOUSE
+    if hand_rank <= 1599:
+        return FLUSH
+    if hand_rank <= 1609:
+        return STRAIGHT
+    if hand_rank <= 2467:
+        return THREE_OF_A_KIND
+    if hand_rank <= 3325:
+        return TWO_PAIR
+    if hand_rank <= 6185:
+        return ONE_PAIR
+    return HIGH_CARD
@@ -1,17 +1,20 @@
-import os
-from dotenv import load_dotenv
+from typing import List, Optional
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-load_dotenv()
-
-class Settings:
+class Settings(BaseSettings):
     # Database
-    DATABASE_URL = os.getenv("DATABASE_URL")
-    
+    DATABASE_URL: Optional[str] = None
+    # Prepared-statement LRU per connection; keep 0 behind transaction-pooled
+    # PgBouncer, raise (e.g. 1024) when connecting to Postgres directly
+    DB_STATEMENT_CACHE_SIZE: int = 0
+
     # API
-    API_V1_STR = "/api/v1"
-    PROJECT_NAME = "Poker Game API"
-    
+    API_V1_STR: str = "/api/v1"
+    PROJECT_NAME: str = "Poker Game API"
+
     # CORS
-    BACKEND_CORS_ORIGINS = ["http://localhost:3000", "http://127.0.0.1:3000"]
+    BACKEND_CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://127.0.0.1:3000"]
+
+    model_config = SettingsConfigDict(env_file=".env")
 
 settings = Settings()
@@ -1,49 +1,49 @@
-import psycopg2
-from psycopg2.extras import RealDictCursor
-from contextlib import contextmanager
-from typing import Generator, Dict, Any, List, Optional
-import json
+import asyncpg
+import orjson
+from typing import Optional
 import logging
 from .config import settings
 
 logger = logging.getLogger(__name__)
 
+async def init_connection(conn: asyncpg.Connection) -> None:
+    """Encode/decode jsonb at the driver layer with orjson"""
+    await conn.set_type_codec(
+        "jsonb",
+        # binary jsonb is a version byte followed by the JSON text
+        encoder=lambda value: b"\x01" + orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS),
+        decoder=lambda data: orjson.loads(data[1:]),
+        schema="pg_catalog",
+        format="binary"
+    )
+
 class DatabaseManager:
-    """Database connection and query manager"""
-    
+    """Owns the asyncpg connection pool for the application"""
+
     def __init__(self):
         self.connection_string = settings.DATABASE_URL
-    
-    @contextmanager
-    def get_connection(self) -> Generator[psycopg2.extensions.connection, None, None]:
-        """Get database connection with automatic cleanup"""
-        conn = None
-        try:
-            conn = psycopg2.connect(self.connection_string)
-            yield conn
-        except Exception as e:
-            if conn:
-                conn.rollback()
-            logger.error(f"Database error: {e}")
-            raise
-        finally:
-            if conn:
-                conn.close()
-    
-    def execute_query(self, query: str, params: tuple = None) -> List[Dict[str, Any]]:
-        """Execute SELECT query and return results"""
-        with self.get_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-                cursor.execute(query, params)
-                return [dict(row) for row in cursor.fetchall()]
-    
-    def execute_command(self, query: str, params: tuple = None) -> int:
-        """Execute INSERT/UPDATE/DELETE and return affected rows"""
-        with self.get_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute(query, params)
-                conn.commit()
-                return cursor.rowcount
+        self.pool: Optional[asyncpg.Pool] = None
+
+    async def connect(self) -> asyncpg.Pool:
+        """Create the shared connection pool if it doesn't exist yet"""
+        if self.pool is None:
+            self.pool = await asyncpg.create_pool(
+                self.connection_string,
+                min_size=5,
+                max_size=20,
+                command_timeout=30,
+                statement_cache_size=settings.DB_STATEMENT_CACHE_SIZE,
+                init=init_connection
+            )
+            logger.info("Database connection pool created")
+        return self.pool
+
+    async def close(self) -> None:
+        """Close the connection pool"""
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+            logger.info("Database connection pool closed")
 
 # Global database instance
 db = DatabaseManager()
@@ -0,0 +1,61 @@
+"""Flat-array cache for equity vectors keyed by removed-card composition.
+
+Equity over board runouts depends only on which ranks have been removed
+from the deck, not on which specific cards removed them. A multiset of
+j removed ranks maps to a unique flat-array address through the
+combinatorial number system: sort the rank indices descending, offset
+the i-th one by its position, and sum precomputed binomials. Repeated
+deck compositions then hit an O(1) table probe instead of re-running
+the ~C(48, 5) board enumeration.
+"""
+
+from math import comb
+from typing import Iterable, Optional
+
+import numpy as np
+
+NUM_RANKS = 13
+
+class EquityCache:
+    """Cache of float32 result vectors addressed by removed-rank multiset"""
+
+    def __init__(self, num_removed: int, vector_size: int, num_ranks: int = NUM_RANKS):
+        self.num_removed = num_removed
+        self.num_ranks = num_ranks
+        # One slot per multiset of num_removed ranks
+        self.size = comb(num_ranks + num_removed - 1, num_removed)
+        self.table = np.full((self.size, vector_size), np.nan, dtype=np.float32)
+        # binomials[i][x] = C(x, i + 1), so addressing is table lookups only
+        self.binomials = [
+            [comb(x, i + 1) for x in range(num_ranks + num_removed)]
+            for i in range(num_removed)
+        ]
+
+    def address(self, removed_ranks: Iterable[int]) -> int:
+        """Flat-array address of a multiset of rank indices"""
+        ranks = sorted(removed_ranks, reverse=True)
+        if len(ranks) != self.num_removed:
+            raise ValueError(
+                f"Expected {self.num_removed} removed ranks, got {len(ranks)}"
+            )
+        address = 0
+        last = self.num_removed - 1
+        for i, rank in enumerate(ranks):
+            # Shift the i-th largest rank by its position to get a strictly
+            # decreasing sequence, then rank it as a plain combination
+            address += self.binomials[last - i][rank + last - i]
+        return address
+
+    def get(self, removed_ranks: Iterable[int]) -> Optional[np.ndarray]:
+        """Return a copy of the cached vector for this composition, or None on a miss"""
+        row = self.table[self.address(removed_ranks)]
+        if np.isnan(row[0]):
+            return None
+        # Copy so callers can't mutate the cache through the returned row
+        return row.copy()
+
+    def put(self, removed_ranks: Iterable[int], vector: Iterable[float]) -> np.ndarray:
+        """Store the vector for this composition and return a copy of the cached row"""
+        address = self.address(removed_ranks)
+        self.table[address] = np.asarray(vector, dtype=np.float32)
+        return self.table[address].copy()
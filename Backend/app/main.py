@@ -1,30 +1,51 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager
 import logging
 
 from .config import settings
+from .database import db
 from .routes.main.routes import router
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the connection pool before traffic arrives, close it on shutdown"""
+    try:
+        app.state.db_pool = await db.connect()
+    except Exception as e:
+        # Boot anyway so /health can report the database as unreachable
+        logger.error(f"Database connection failed at startup: {e}")
+        app.state.db_pool = None
+    yield
+    await db.close()
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version="1.0.0",
-    description="Poker Game Backend API"
+    description="Poker Game Backend API",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# Add CORS middleware
+# Add CORS middleware, locked to the frontend origins and the methods we serve
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.BACKEND_CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Content-Type"],
 )
 
+# Compress list/export responses; their repeated JSON keys shrink well
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Include routers
 app.include_router(router)
 
@@ -1,37 +1,25 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from pydantic import BaseModel
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-import json
 
-@dataclass
+@dataclass(slots=True)
 class HandPositions:
     dealer: int
     small_blind: int
     big_blind: int
 
-@dataclass
+@dataclass(slots=True)
 class HandRecord:
     """Hand record entity - matches frontend HandResult interface"""
-    hand_id: str
+    hand_id: Optional[str]  # None until assigned by the database
     stack_settings: List[int]
     positions: HandPositions
     hole_cards: Dict[int, str]  # player_id -> cards (e.g., "AhKs")
     action_sequence: str
     winnings: Dict[int, int]  # player_id -> amount won/lost
     timestamp: datetime
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
-        return {
-            "hand_id": self.hand_id,
-            "stack_settings": self.stack_settings,
-            "positions": asdict(self.positions),
-            "hole_cards": self.hole_cards,
-            "action_sequence": self.action_sequence,
-            "winnings": self.winnings,
-            "timestamp": self.timestamp.isoformat()
-        }
-    
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'HandRecord':
         """Create from dictionary"""
@@ -45,8 +33,7 @@ class HandRecord:
             timestamp=datetime.fromisoformat(data["timestamp"])
         )
 
-@dataclass
-class HandCreateRequest:
+class HandCreateRequest(BaseModel):
     """Request model for creating a hand"""
     stack_settings: List[int]
     positions: Dict[str, int]
@@ -54,8 +41,7 @@ class HandCreateRequest:
     action_sequence: str
     winnings: Dict[str, int]
 
-@dataclass
-class HandValidationRequest:
+class HandValidationRequest(BaseModel):
     """Request model for hand validation"""
     hole_cards: Dict[str, str]
     community_cards: List[str]
@@ -1,12 +1,13 @@
-from fastapi import APIRouter, HTTPException, status
-from typing import List, Dict, Any
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from async_lru import alru_cache
+import orjson
+from typing import List, Dict, Any, Optional
 import uuid
 from datetime import datetime
-import json
 import logging
 
 from ...model import HandRecord, HandCreateRequest, HandValidationRequest, HandPositions
-from ...database import db
 
 # Import pokerkit for hand validation
 try:
@@ -18,108 +19,163 @@ except ImportError:
 
 router = APIRouter(prefix="/api/v1", tags=["hands"])
 
-@router.post("/hands/", response_model=Dict[str, Any])
-async def create_hand(request: HandCreateRequest):
-    """Create a new hand record"""
-    try:
-        # Validate pokerkit is available
-        if not POKERKIT_AVAILABLE:
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail="pokerkit library is not available"
-            )
+def rows_affected_from(status_tag: str) -> int:
+    """Parse the affected-row count out of an asyncpg status tag like 'INSERT 0 1'"""
+    return int(status_tag.rsplit(" ", 1)[-1])
 
-        used_cards = set()
+INSERT_HAND_SQL = """
+INSERT INTO hands (
+    stack_settings, dealer_position, small_blind_position,
+    big_blind_position, hole_cards, action_sequence, winnings, created_at
+) VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+ON CONFLICT (hand_id) DO NOTHING
+RETURNING hand_id
+"""
 
-        for player_id_str, card_str in request.hole_cards.items():
-            if len(card_str) != 4:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Hole cards for player {player_id_str} must be 4 characters like 'AsKd'"
-                )
-            try:
-                # Parse the two cards for this player
-                card1 = Card(card_str[0], card_str[1])
-                card2 = Card(card_str[2], card_str[3])
+BATCH_INSERT_HAND_SQL = """
+INSERT INTO hands (
+    hand_id, stack_settings, dealer_position, small_blind_position,
+    big_blind_position, hole_cards, action_sequence, winnings, created_at
+) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+ON CONFLICT (hand_id) DO NOTHING
+"""
 
-            except Exception as e:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Invalid card format for player {player_id_str}: {card_str} ({e})"
-                )
-            
-            for card in (card1, card2):
-                if card in used_cards:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail=f"Duplicate card detected: {card}"
-                    )
-                used_cards.add(card)
-
-        # Generate unique hand ID
-        hand_id = str(uuid.uuid4())
-        
-        # Convert request to HandRecord
-        positions = HandPositions(
-            dealer=request.positions["dealer"],
-            small_blind=request.positions["small_blind"],
-            big_blind=request.positions["big_blind"]
+HAND_COLUMNS = [
+    "hand_id", "stack_settings", "dealer_position", "small_blind_position",
+    "big_blind_position", "hole_cards", "action_sequence", "winnings", "created_at"
+]
+
+# Above this many hands, COPY beats row-by-row INSERT
+COPY_BATCH_THRESHOLD = 100
+
+# Card bit layout: one bit per deck card, suit * 13 + rank
+RANK_IDX = {rank: i for i, rank in enumerate("23456789TJQKA")}
+SUIT_IDX = {"s": 0, "h": 1, "d": 2, "c": 3}
+
+# Precomputed two-char card -> deck bit, so validation is one table probe
+# per card; an unknown rank or suit simply isn't a key
+CARD_BIT = {
+    rank + suit: 1 << (SUIT_IDX[suit] * 13 + RANK_IDX[rank])
+    for rank in RANK_IDX
+    for suit in SUIT_IDX
+}
+
+def add_card_to_mask(mask: int, card: str, context: str) -> int:
+    """OR one card's bit into the deck mask, rejecting bad syntax and duplicates"""
+    try:
+        bit = CARD_BIT[card]
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid card format {context}: {card}"
         )
-        
-        # Convert string keys to int keys for consistency
-        hole_cards = {int(k): v for k, v in request.hole_cards.items()}
-        winnings = {int(k): v for k, v in request.winnings.items()}
-        
-        hand_record = HandRecord(
-            hand_id=hand_id,
-            stack_settings=request.stack_settings,
-            positions=positions,
-            hole_cards=hole_cards,
-            action_sequence=request.action_sequence,
-            winnings=winnings,
-            timestamp=datetime.now()
+    if mask & bit:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Duplicate card detected: {card}"
         )
-        
-        # Calculate total winnings for validation
-        total_winnings = sum(winnings.values())
-        if abs(total_winnings) > 1:  # Allow for small rounding errors
+    return mask | bit
+
+def validate_hole_cards(hole_cards: Dict[str, str], mask: int = 0) -> int:
+    """Validate each player's hole cards and reject duplicates across players"""
+    # The whole deck fits in a 52-bit mask, so the duplicate check is one
+    # AND/OR per card instead of hashing Card objects into a set
+    for player_id_str, card_str in hole_cards.items():
+        if len(card_str) != 4:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Winnings must sum to zero, got {total_winnings}"
+                detail=f"Hole cards for player {player_id_str} must be 4 characters like 'AsKd'"
             )
-        
-        # Insert into database
-        query = """
-        INSERT INTO hands (
-            hand_id, stack_settings, dealer_position, small_blind_position, 
-            big_blind_position, hole_cards, action_sequence, winnings, created_at
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
-        
-        params = (
-            hand_record.hand_id,
-            json.dumps(hand_record.stack_settings),
-            hand_record.positions.dealer,
-            hand_record.positions.small_blind,
-            hand_record.positions.big_blind,
-            json.dumps(hand_record.hole_cards),
-            hand_record.action_sequence,
-            json.dumps(hand_record.winnings),
-            hand_record.timestamp
+        for i in range(0, 4, 2):
+            mask = add_card_to_mask(
+                mask, card_str[i:i + 2], f"for player {player_id_str}"
+            )
+    return mask
+
+def build_hand_record(payload: HandCreateRequest) -> HandRecord:
+    """Validate a create request and convert it to a HandRecord"""
+    validate_hole_cards(payload.hole_cards)
+
+    # Convert request to HandRecord
+    positions = HandPositions(
+        dealer=payload.positions["dealer"],
+        small_blind=payload.positions["small_blind"],
+        big_blind=payload.positions["big_blind"]
+    )
+
+    # Convert string keys to int keys for consistency
+    hole_cards = {int(k): v for k, v in payload.hole_cards.items()}
+    winnings = {int(k): v for k, v in payload.winnings.items()}
+
+    # Calculate total winnings for validation
+    total_winnings = sum(winnings.values())
+    if abs(total_winnings) > 1:  # Allow for small rounding errors
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Winnings must sum to zero, got {total_winnings}"
         )
-        
-        rows_affected = db.execute_command(query, params)
-        
-        if rows_affected == 0:
+
+    return HandRecord(
+        hand_id=None,  # assigned by the database (gen_random_uuid)
+        stack_settings=payload.stack_settings,
+        positions=positions,
+        hole_cards=hole_cards,
+        action_sequence=payload.action_sequence,
+        winnings=winnings,
+        timestamp=datetime.now()
+    )
+
+def hand_record_row(hand_record: HandRecord) -> tuple:
+    """Flatten a HandRecord into the hands table column order"""
+    return (
+        hand_record.hand_id,
+        hand_record.stack_settings,
+        hand_record.positions.dealer,
+        hand_record.positions.small_blind,
+        hand_record.positions.big_blind,
+        hand_record.hole_cards,
+        hand_record.action_sequence,
+        hand_record.winnings,
+        hand_record.timestamp
+    )
+
+@router.post("/hands/", response_model=Dict[str, Any])
+async def create_hand(payload: HandCreateRequest, request: Request):
+    """Create a new hand record"""
+    try:
+        hand_record = build_hand_record(payload)
+
+        # hand_id is generated in the same round-trip by the database
+        hand_id = await request.app.state.db_pool.fetchval(
+            INSERT_HAND_SQL, *hand_record_row(hand_record)[1:]
+        )
+
+        if hand_id is None:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to create hand record"
             )
-        
+
+        hand_id = str(hand_id)
+        hand_record.hand_id = hand_id
+
+        # Shallow dict literal instead of asdict()'s recursive deep copy
         return {
             "hand_id": hand_id,
             "message": "Hand created successfully",
-            "data": hand_record.to_dict()
+            "data": {
+                "hand_id": hand_id,
+                "stack_settings": hand_record.stack_settings,
+                "positions": {
+                    "dealer": hand_record.positions.dealer,
+                    "small_blind": hand_record.positions.small_blind,
+                    "big_blind": hand_record.positions.big_blind
+                },
+                "hole_cards": hand_record.hole_cards,
+                "action_sequence": hand_record.action_sequence,
+                "winnings": hand_record.winnings,
+                "timestamp": hand_record.timestamp.isoformat()
+            }
         }
         
     except HTTPException:
@@ -131,38 +187,142 @@ async def create_hand(request: HandCreateRequest):
             detail=str(e)
         )
 
-@router.get("/hands/", response_model=List[Dict[str, Any]])
-async def get_all_hands():
-    """Get all hand records"""
+@router.post("/hands/batch", response_model=Dict[str, Any])
+async def create_hands_batch(payloads: List[HandCreateRequest], request: Request):
+    """Create many hand records in a single transaction"""
     try:
-        query = """
-        SELECT hand_id, stack_settings, dealer_position, small_blind_position,
-               big_blind_position, hole_cards, action_sequence, winnings, created_at
-        FROM hands 
-        ORDER BY created_at DESC
-        """
-        
-        rows = db.execute_query(query)
-        
-        hands = []
-        for row in rows:
-            hand_data = {
-                "handId": row["hand_id"],
-                "stackSettings": row["stack_settings"],
-                "positions": {
-                    "dealer": row["dealer_position"],
-                    "smallBlind": row["small_blind_position"],
-                    "bigBlind": row["big_blind_position"]
-                },
-                "holeCards": row["hole_cards"],
-                "actionSequence": row["action_sequence"],
-                "winnings": row["winnings"],
-                "timestamp": row["created_at"].isoformat()
-            }
-            hands.append(hand_data)
-        
-        return hands
-        
+        if not payloads:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Batch must contain at least one hand"
+            )
+
+        hand_records = [build_hand_record(payload) for payload in payloads]
+        # COPY/executemany can't surface DB-generated ids, so assign them here
+        for hand_record in hand_records:
+            hand_record.hand_id = str(uuid.uuid4())
+        records = [hand_record_row(hand_record) for hand_record in hand_records]
+
+        async with request.app.state.db_pool.acquire() as conn:
+            if len(records) >= COPY_BATCH_THRESHOLD:
+                # COPY bypasses per-row parse/plan entirely for large batches
+                await conn.copy_records_to_table(
+                    "hands", records=records, columns=HAND_COLUMNS
+                )
+            else:
+                # One transaction amortizes commit cost over the batch
+                async with conn.transaction():
+                    await conn.executemany(BATCH_INSERT_HAND_SQL, records)
+
+        return {
+            "hand_ids": [hand_record.hand_id for hand_record in hand_records],
+            "count": len(hand_records),
+            "message": f"{len(hand_records)} hands created successfully"
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logging.error(f"Error creating hands batch: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+@router.post("/hands/validate", response_model=Dict[str, Any])
+async def validate_hand(payload: HandValidationRequest):
+    """Validate hole and community cards without persisting anything"""
+    try:
+        mask = validate_hole_cards(payload.hole_cards)
+        for card_str in payload.community_cards:
+            if len(card_str) != 2:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Community cards must be 2 characters like 'Tc', got {card_str}"
+                )
+            mask = add_card_to_mask(mask, card_str, "on the board")
+
+        return {"valid": True}
+
+    except HTTPException as e:
+        if e.status_code == status.HTTP_400_BAD_REQUEST:
+            return {"valid": False, "error": e.detail}
+        raise
+    except Exception as e:
+        logging.error(f"Error validating hand: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
+
+# Shape each row into the camelCase response object in SQL so the endpoints
+# return wire-ready JSON instead of rebuilding N dicts in Python
+HAND_JSON_OBJECT = """jsonb_build_object(
+    'handId', hand_id,
+    'stackSettings', stack_settings,
+    'positions', jsonb_build_object(
+        'dealer', dealer_position,
+        'smallBlind', small_blind_position,
+        'bigBlind', big_blind_position
+    ),
+    'holeCards', hole_cards,
+    'actionSequence', action_sequence,
+    'winnings', winnings,
+    'timestamp', to_char(created_at, 'YYYY-MM-DD"T"HH24:MI:SS.US')
+)"""
+
+HAND_PAGE_SQL = f"""
+SELECT {HAND_JSON_OBJECT} AS hand, created_at, hand_id
+FROM hands
+WHERE ($1::timestamp IS NULL OR (created_at, hand_id) < ($1, $2::uuid))
+ORDER BY created_at DESC, hand_id DESC
+LIMIT $3
+"""
+
+HAND_STREAM_SQL = f"""
+SELECT {HAND_JSON_OBJECT} AS hand
+FROM hands
+ORDER BY created_at DESC
+"""
+
+@router.get("/hands/", response_model=Dict[str, Any])
+async def get_all_hands(
+    request: Request,
+    cursor: Optional[str] = Query(None, description="Opaque '<created_at>,<hand_id>' keyset cursor"),
+    limit: int = Query(100, ge=1, le=500)
+):
+    """Get hand records, newest first, with keyset pagination"""
+    try:
+        cursor_ts = cursor_id = None
+        if cursor is not None:
+            try:
+                ts_str, sep, id_str = cursor.partition(",")
+                if not sep:
+                    raise ValueError("missing separator")
+                cursor_ts = datetime.fromisoformat(ts_str)
+                cursor_id = str(uuid.UUID(id_str))
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid cursor: {cursor}"
+                )
+
+        rows = await request.app.state.db_pool.fetch(
+            HAND_PAGE_SQL, cursor_ts, cursor_id, limit
+        )
+
+        next_cursor = None
+        if len(rows) == limit:
+            last = rows[-1]
+            next_cursor = f"{last['created_at'].isoformat()},{last['hand_id']}"
+
+        return ORJSONResponse(content={
+            "items": [row["hand"] for row in rows],
+            "next_cursor": next_cursor
+        })
+
+    except HTTPException:
+        raise
     except Exception as e:
         logging.error(f"Error fetching hands: {e}")
         raise HTTPException(
@@ -170,40 +330,87 @@ async def get_all_hands():
             detail=str(e)
         )
 
+@router.get("/hands/export")
+async def export_all_hands(request: Request):
+    """Stream every hand as one JSON array in constant memory"""
+    pool = request.app.state.db_pool
+
+    async def generate():
+        yield b"["
+        first = True
+        # The server-side cursor produces rows as Postgres emits them,
+        # so memory use stays flat regardless of table size
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                async for record in conn.cursor(HAND_STREAM_SQL):
+                    prefix = b"" if first else b","
+                    yield prefix + orjson.dumps(record["hand"])
+                    first = False
+        yield b"]"
+
+    return StreamingResponse(generate(), media_type="application/json")
+
+GET_HAND_SQL = """
+SELECT hand_id, stack_settings, dealer_position, small_blind_position,
+       big_blind_position, hole_cards, action_sequence, winnings, created_at
+FROM hands
+WHERE hand_id = $1
+"""
+
+DELETE_HAND_SQL = "DELETE FROM hands WHERE hand_id = $1"
+
+def require_uuid(hand_id: str) -> str:
+    """Canonicalize the id or 404, before it hits the pool or cache.
+
+    uuid.UUID accepts uppercase, un-dashed and braced spellings that all
+    resolve to the same row, so the cache must key on the canonical form.
+    """
+    try:
+        return str(uuid.UUID(hand_id))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Hand {hand_id} not found"
+        )
+
+@alru_cache(maxsize=10_000)
+async def fetch_hand(pool, hand_id: str) -> Optional[Dict[str, Any]]:
+    """Fetch one hand; cacheable because hands are immutable after creation"""
+    row = await pool.fetchrow(GET_HAND_SQL, hand_id)
+    if row is None:
+        return None
+    return {
+        "handId": row["hand_id"],
+        "stackSettings": row["stack_settings"],
+        "positions": {
+            "dealer": row["dealer_position"],
+            "smallBlind": row["small_blind_position"],
+            "bigBlind": row["big_blind_position"]
+        },
+        "holeCards": row["hole_cards"],
+        "actionSequence": row["action_sequence"],
+        "winnings": row["winnings"],
+        "timestamp": row["created_at"].isoformat()
+    }
+
 @router.get("/hands/{hand_id}", response_model=Dict[str, Any])
-async def get_hand(hand_id: str):
+async def get_hand(hand_id: str, request: Request):
     """Get a specific hand by ID"""
     try:
-        query = """
-        SELECT hand_id, stack_settings, dealer_position, small_blind_position,
-               big_blind_position, hole_cards, action_sequence, winnings, created_at
-        FROM hands 
-        WHERE hand_id = %s
-        """
-        
-        rows = db.execute_query(query, (hand_id,))
-        
-        if not rows:
+        hand_id = require_uuid(hand_id)
+        pool = request.app.state.db_pool
+        hand = await fetch_hand(pool, hand_id)
+
+        if hand is None:
+            # Don't pin misses: the record may be created later
+            fetch_hand.cache_invalidate(pool, hand_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Hand {hand_id} not found"
             )
-        
-        row = rows[0]
-        return {
-            "handId": row["hand_id"],
-            "stackSettings": row["stack_settings"],
-            "positions": {
-                "dealer": row["dealer_position"],
-                "smallBlind": row["small_blind_position"],
-                "bigBlind": row["big_blind_position"]
-            },
-            "holeCards": row["hole_cards"],
-            "actionSequence": row["action_sequence"],
-            "winnings": row["winnings"],
-            "timestamp": row["created_at"].isoformat()
-        }
-        
+        return hand
+
+
     except HTTPException:
         raise
     except Exception as e:
@@ -214,18 +421,23 @@ async def get_hand(hand_id: str):
         )
 
 @router.delete("/hands/{hand_id}")
-async def delete_hand(hand_id: str):
+async def delete_hand(hand_id: str, request: Request):
     """Delete a specific hand"""
     try:
-        query = "DELETE FROM hands WHERE hand_id = %s"
-        rows_affected = db.execute_command(query, (hand_id,))
-        
+        hand_id = require_uuid(hand_id)
+        pool = request.app.state.db_pool
+        status_tag = await pool.execute(DELETE_HAND_SQL, hand_id)
+        rows_affected = rows_affected_from(status_tag)
+
         if rows_affected == 0:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Hand {hand_id} not found"
             )
-        
+
+        # Deletion is the only way a cached hand goes stale
+        fetch_hand.cache_invalidate(pool, hand_id)
+
         return {"message": f"Hand {hand_id} deleted successfully"}
         
     except HTTPException:
@@ -238,11 +450,11 @@ async def delete_hand(hand_id: str):
         )
 
 @router.get("/health")
-async def health_check():
+async def health_check(request: Request):
     """Health check endpoint"""
     try:
         # Test database connection
-        db.execute_query("SELECT 1")
+        await request.app.state.db_pool.fetchval("SELECT 1")
         return {
             "status": "healthy",
             "database": "connected",
@@ -4,20 +4,20 @@ Management script for the poker backend
 """
 import sys
 import subprocess
-import psycopg2
+import psycopg
 from app.config import settings
 
 def create_table():
     """Create the database table"""
     try:
-        conn = psycopg2.connect(settings.DATABASE_URL)
+        conn = psycopg.connect(settings.DATABASE_URL)
         
         with conn.cursor() as cursor:
             # Create hands table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS hands (
                     id SERIAL PRIMARY KEY,
-                    hand_id VARCHAR(36) UNIQUE NOT NULL,
+                    hand_id UUID UNIQUE NOT NULL DEFAULT gen_random_uuid(),
                     stack_settings JSONB NOT NULL,
                     dealer_position INTEGER NOT NULL,
                     small_blind_position INTEGER NOT NULL,
@@ -37,7 +37,17 @@ def create_table():
             
             # Create indexes
             cursor.execute("CREATE INDEX IF NOT EXISTS idx_hands_hand_id ON hands(hand_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_hands_created_at ON hands(created_at)")
+            # Covering index so the keyset listing query is an Index Only Scan;
+            # hand_id must be a key column for the (created_at, hand_id) row
+            # comparison and tiebreak ordering to use the index
+            cursor.execute("DROP INDEX IF EXISTS idx_hands_created_at")
+            cursor.execute("DROP INDEX IF EXISTS idx_hands_list")
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_hands_keyset
+                ON hands (created_at DESC, hand_id DESC)
+                INCLUDE (stack_settings, dealer_position, small_blind_position,
+                         big_blind_position, hole_cards, action_sequence, winnings)
+            """)
             
             conn.commit()
             print("✅ Table created successfully")
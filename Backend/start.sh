@@ -6,12 +6,12 @@ set -e
 # Wait for Postgres using a Python one-liner
 echo "⏳ Waiting for the database to be ready..."
 until python -c "
-import psycopg2
+import psycopg
 import time
 import sys
 
 try:
-    conn = psycopg2.connect(
+    conn = psycopg.connect(
         dbname='poker_db',
         user='postgres',
         password='password',
@@ -3,28 +3,32 @@ import json
 from fastapi.testclient import TestClient
 from app.main import app
 
-client = TestClient(app)
+@pytest.fixture
+def client():
+    # Entering the context runs the lifespan, which creates app.state.db_pool
+    with TestClient(app) as test_client:
+        yield test_client
 
-def test_health_check():
+def test_health_check(client):
     """Test health check endpoint"""
     response = client.get("/api/v1/health")
     assert response.status_code == 200
     data = response.json()
     assert "status" in data
 
-def test_create_hand():
+def test_create_hand(client):
     """Test creating a hand"""
     hand_data = {
         "stack_settings": [1000, 1000, 1000, 1000, 1000, 1000],
         "positions": {
             "dealer": 0,
-            "smallBlind": 1,
-            "bigBlind": 2
+            "small_blind": 1,
+            "big_blind": 2
         },
         "hole_cards": {
             "0": "AhKs",
             "1": "QdJc",
-            "2": "TsT9h",
+            "2": "Ts9h",
             "3": "8h7d",
             "4": "6c5s",
             "5": "4h3d"
@@ -46,14 +50,15 @@ def test_create_hand():
     assert "hand_id" in data
     assert data["message"] == "Hand created successfully"
 
-def test_get_hands():
+def test_get_hands(client):
     """Test getting all hands"""
     response = client.get("/api/v1/hands/")
     assert response.status_code == 200
     data = response.json()
-    assert isinstance(data, list)
+    assert isinstance(data["items"], list)
+    assert "next_cursor" in data
 
-def test_validate_hand():
+def test_validate_hand(client):
     """Test hand validation"""
     validation_data = {
         "hole_cards": {
@@ -0,0 +1,34 @@
+import pytest
+from app import cardtools
+
+def test_table_sizes():
+    """All 7462 distinct hand values are covered"""
+    assert len(cardtools.FLUSH_RANKS) == 1287
+    assert len(cardtools.UNSUITED_RANKS) == 6175
+    ranks = set(cardtools.FLUSH_RANKS.values()) | set(cardtools.UNSUITED_RANKS.values())
+    assert len(ranks) == cardtools.NUM_HAND_RANKS
+
+def test_evaluate_five_ordering():
+    """Known hands land on their known ranks"""
+    royal = cardtools.encode_cards(["As", "Ks", "Qs", "Js", "Ts"])
+    assert cardtools.evaluate_five(*royal) == 1
+
+    wheel = cardtools.encode_cards(["As", "2s", "3s", "4s", "5s"])
+    assert cardtools.evaluate_five(*wheel) == 10
+
+    worst = cardtools.encode_cards(["7h", "5d", "4c", "3s", "2h"])
+    assert cardtools.evaluate_five(*worst) == 7462
+
+def test_evaluate_seven_picks_best_five():
+    """Seven-card evaluation finds the best five-card hand"""
+    cards = cardtools.encode_cards(["As", "Ks", "Qs", "Js", "Ts", "2d", "3c"])
+    assert cardtools.evaluate_seven(cards) == 1
+
+def test_hand_category():
+    """Rank boundaries map back to the right categories"""
+    assert cardtools.hand_category(1) == cardtools.STRAIGHT_FLUSH
+    assert cardtools.hand_category(11) == cardtools.FOUR_OF_A_KIND
+    assert cardtools.hand_category(7462) == cardtools.HIGH_CARD
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
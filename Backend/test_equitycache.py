@@ -0,0 +1,26 @@
+import pytest
+from itertools import combinations_with_replacement
+from app.equitycache import EquityCache
+
+def test_address_is_a_bijection():
+    """Every multiset of removed ranks gets a unique in-range address"""
+    cache = EquityCache(num_removed=4, vector_size=13)
+    addresses = {
+        cache.address(multiset)
+        for multiset in combinations_with_replacement(range(13), 4)
+    }
+    assert len(addresses) == cache.size
+    assert min(addresses) == 0
+    assert max(addresses) == cache.size - 1
+
+def test_get_put_is_order_independent():
+    """The cache keys on the multiset, not the order cards were removed"""
+    cache = EquityCache(num_removed=4, vector_size=13)
+    assert cache.get([0, 5, 5, 12]) is None
+    cache.put([0, 5, 5, 12], [0.5] * 13)
+    row = cache.get([5, 12, 0, 5])
+    assert row is not None
+    assert row[0] == pytest.approx(0.5)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -70,13 +70,25 @@ export class PokerAPI {
     try {
       console.log("🔄 Fetching hands from backend...")
 
-      const response = await fetch(`${API_BASE_URL}/hands/`)
+      const hands: any[] = []
+      let cursor: string | null = null
 
-      if (!response.ok) {
-        throw new Error(`Failed to fetch hands: ${response.statusText}`)
-      }
+      // The backend paginates with a keyset cursor; follow it until exhausted
+      do {
+        const url: string = cursor
+          ? `${API_BASE_URL}/hands/?cursor=${encodeURIComponent(cursor)}`
+          : `${API_BASE_URL}/hands/`
+        const response = await fetch(url)
+
+        if (!response.ok) {
+          throw new Error(`Failed to fetch hands: ${response.statusText}`)
+        }
+
+        const data = await response.json()
+        hands.push(...data.items)
+        cursor = data.next_cursor
+      } while (cursor)
 
-      const hands = await response.json()
       console.log(`✅ Fetched ${hands.length} hands from backend`)
       return hands
     } catch (error) {